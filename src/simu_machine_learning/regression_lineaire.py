@@ -97,22 +97,11 @@ data = [
     },
 ]
 
-X = []
-Y = []
-
-for sample in data:
-    # Entrée : conditions initiales
-    X.append(sample["initial"])
-    # Sortie : trajectoire formatée en un vecteur
-    traj = sample["trajectory"]
-    flat_traj = []
-    for point in traj:
-        for coord in point:
-            flat_traj.append(coord)
-    Y.append(flat_traj)
-
-X = np.array(X, dtype=np.float32)
-Y = np.array(Y, dtype=np.float32)
+# Entrée : conditions initiales
+X = np.array([sample["initial"] for sample in data], dtype=np.float32)
+# Sortie : trajectoire formatée en un vecteur (n_points x 2 -> 2 * n_points)
+Y = np.array([sample["trajectory"] for sample in data], dtype=np.float32)
+Y = Y.reshape(len(data), -1)
 
 print("Shape X:", X.shape)  # (n_samples, 4)
 print("Shape Y:", Y.shape)  # (n_samples, 40)
@@ -1,18 +1,22 @@
+import numpy as np
+
+
 class Bille:
     """
     A class representing a ball in a 2D space, with properties for position, velocity, and acceleration.
     """
 
-    def __init__(self, x: float, y: float, vx: float, vy: float):
+    def __init__(self, x: float, y: float, vx: float, vy: float, n_steps: int):
         self._x = x
         self._y = y
         self._vx = vx
         self._vy = vy
         self._ax = 0.0
         self._ay = 0.0
-        self._xs = []
-        self._ys = []
-        self._zs = []
+        self._xs = np.empty(n_steps, dtype=np.float64)
+        self._ys = np.empty(n_steps, dtype=np.float64)
+        self._zs = np.empty(n_steps, dtype=np.float64)
+        self._n = 0
 
     def update_position(self, dt: float):
         """
@@ -36,6 +40,25 @@ class Bille:
         self._vx += ax * dt
         self._vy += ay * dt
 
+    def integrate_with(self, kernel, height, *params):
+        """
+        Runs an integrator that fills the history of the ball, then updates the ball from its final state.
+
+        Args:
+            kernel (callable): The integrator, called as kernel(x, y, vx, vy, *params, xs, ys). It writes the
+                trajectory into xs and ys and returns (x, y, vx, vy, ax, ay, n), n being the number of steps written.
+            height (callable): The height of the surface, called as height(xs, ys, out=zs) on the recorded steps.
+            *params: The parameters passed to the integrator after the initial state of the ball.
+        """
+        x, y, vx, vy, ax, ay, n = kernel(
+            self._x, self._y, self._vx, self._vy, *params, self._xs, self._ys
+        )
+        self._x, self._y = x, y
+        self._vx, self._vy = vx, vy
+        self._ax, self._ay = ax, ay
+        self._n = n
+        height(self._xs[:n], self._ys[:n], out=self._zs[:n])
+
     @property
     def get_position(self):
         return self._x, self._y
@@ -82,4 +105,4 @@ class Bille:
 
     @property
     def get_positions_history(self):
-        return self._xs, self._ys, self._zs
\ No newline at end of file
+        return self._xs[: self._n], self._ys[: self._n], self._zs[: self._n]
@@ -12,6 +12,7 @@ k_depth = 0.1
 k_sigma = 2.0
 depth = k_depth * M_sun
 sigma = k_sigma * sun_radius
+inv_two_sigma2 = 1.0 / (2 * sigma**2)  # facteur de l'exponentielle du drap
 
 # Bille
 x, y = 2.0, 0.0 # position initiale de la bille
@@ -1,5 +1,5 @@
 import numpy as np
-from constantes import depth, sigma
+from constantes import depth, inv_two_sigma2
 
 
 class Drap:
@@ -13,19 +13,25 @@ class Drap:
         self._mu = mu
 
     @staticmethod
-    def h(x, y) -> float:
+    def h(x, y, out=None) -> float | np.ndarray:
         """
         Computes the height of the drape at a given position (x, y).
 
         Args:
             x (float): The x-coordinate of the position.
             y (float): The y-coordinate of the position.
+            out (np.ndarray, optional): An array receiving the heights when x and y are arrays.
 
         Returns:
-            float: The height of the drape at the given position.
+            float | np.ndarray: The height of the drape at the given position, an array (out if given) for array inputs.
         """
-        r2 = x**2 + y**2
-        return -depth * np.exp(-r2 / (2 * sigma**2))
+        r2 = np.square(x, dtype=np.float64) + np.square(
+            y, dtype=np.float64
+        )  # float64 and broadcast over x and y, so the in-place ops below are always valid
+        r2 *= -inv_two_sigma2
+        out = np.exp(r2, out=out)
+        out *= -depth
+        return out
 
     @property
     def get_depth(self):
@@ -1,3 +1,4 @@
+from functools import lru_cache
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import animation
@@ -5,6 +6,51 @@ from constantes import *
 from soleil import Soleil
 from drap import Drap
 from bille import Bille
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def integrate(x, y, vx, vy, gm, mu, radius, dt, xs, ys):
+    """
+    Integrates the motion of the ball around the Sun with a semi-implicit Euler scheme.
+
+    The positions are written into xs and ys, one per step, until the ball touches the Sun
+    or the buffers are full.
+
+    Args:
+        x (float): The initial x-coordinate of the ball.
+        y (float): The initial y-coordinate of the ball.
+        vx (float): The initial velocity in the x direction.
+        vy (float): The initial velocity in the y direction.
+        gm (float): The product of the gravitational constant and the mass of the Sun.
+        mu (float): The friction coefficient of the drape.
+        radius (float): The radius of the Sun.
+        dt (float): The time step of the simulation.
+        xs (np.ndarray): The buffer receiving the x-coordinates of the trajectory.
+        ys (np.ndarray): The buffer receiving the y-coordinates of the trajectory.
+
+    Returns:
+        tuple: The final position, velocity and acceleration of the ball, and the number of steps written.
+    """
+    ax = 0.0
+    ay = 0.0
+    n = 0
+    radius_sq = radius * radius
+    for i in range(xs.shape[0]):
+        r2 = x * x + y * y  # distance bille-Soleil au carré
+        if r2 < radius_sq:  # contact avec le Soleil
+            break
+        k = gm / r2
+        ax = -k * x - mu * vx  # accélération en x
+        ay = -k * y - mu * vy  # accélération en y
+        vx += ax * dt  # mise à jour de la vitesse
+        vy += ay * dt
+        x += vx * dt  # mise à jour de la position
+        y += vy * dt
+        xs[i] = x
+        ys[i] = y
+        n = i + 1
+    return x, y, vx, vy, ax, ay, n
 
 
 class Simulation:
@@ -22,39 +68,24 @@ class Simulation:
     ):
         self._sun = Soleil(sun_radius, M_sun)
         self._drap = Drap(k_depth, k_sigma, M_sun, sun_radius, mu)
-        self._bille = Bille(x, y, vx, vy)
+        self._bille = Bille(x, y, vx, vy, steps)
         self._run()
 
     def _run(self):
-        for _ in range(steps):
-            r = np.sqrt(
-                self._bille.get_x**2 + self._bille.get_y**2
-            )  # distance bille-Soleil
-            if r < self._sun.get_radius:  # contact avec le Soleil
-                break
-            self._bille.set_ax = (
-                -G * self._sun.get_mass * self._bille.get_x / r**2
-                - self._drap.get_mu * self._bille.get_velocity[0]
-            )  # accélération en x
-            self._bille.set_ay = (
-                -G * self._sun.get_mass * self._bille.get_y / r**2
-                - self._drap.get_mu * self._bille.get_velocity[1]
-            )  # accélération en y
-            self._bille.update_velocity(
-                self._bille.get_acceleration[0], self._bille.get_acceleration[1], dt
-            )  # mise à jour de la vitesse
-            self._bille.update_position(dt)  # mise à jour de la position
-            self._bille._xs.append(self._bille.get_x)
-            self._bille._ys.append(self._bille.get_y)
-            self._bille._zs.append(self._drap.h(self._bille.get_x, self._bille.get_y))
+        self._bille.integrate_with(
+            integrate,
+            self._drap.h,  # hauteur du drap sur toute la trajectoire
+            G * self._sun.get_mass,
+            self._drap.get_mu,
+            self._sun.get_radius,
+            dt,
+        )
         self._plot()
 
     def _plot(self):
         fig = plt.figure(figsize=(9, 6))
         ax = fig.add_subplot(111, projection="3d")
-        grid = np.linspace(-3, 3, 150)
-        X, Y = np.meshgrid(grid, grid)
-        Z = self._drap.h(X, Y)
+        X, Y, Z = self._surface_mesh()
         ax.plot_surface(X, Y, Z, cmap="plasma", alpha=0.8)
         ax.plot_surface(
             self._sun.get_X_sun,
@@ -63,26 +94,24 @@ class Simulation:
             color="gold",
             shade=True,
         )
+        xs, ys, zs = self._bille.get_positions_history
         (animated_bille,) = ax.plot(
-            [self._bille.get_positions_history[0][0]],
-            [self._bille.get_positions_history[1][0]],
-            [self._bille.get_positions_history[2][0] + 0.05],
+            [xs[0]],
+            [ys[0]],
+            [zs[0] + 0.05],
             "o",
             color="blue",
         )
 
         def update(i):
-            animated_bille.set_data(
-                [self._bille.get_positions_history[0][i]],
-                [self._bille.get_positions_history[1][i]],
-            )
-            animated_bille.set_3d_properties([self._bille.get_positions_history[2][i] + 0.05])  # type: ignore
+            animated_bille.set_data([xs[i]], [ys[i]])
+            animated_bille.set_3d_properties([zs[i] + 0.05])  # type: ignore
             return (animated_bille,)
 
         ani = animation.FuncAnimation(
             fig,
             update,
-            frames=len(self._bille.get_positions_history[0]),
+            frames=len(xs),
             interval=10,
             blit=True,
         )
@@ -93,6 +122,26 @@ class Simulation:
         self._set_axes_equal(ax)
         plt.show()
 
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _surface_mesh(n: int = 150, extent: float = 3.0):
+        """
+        Builds the mesh of the drape surface, cached since it only depends on the resolution and extent.
+
+        Args:
+            n (int): The number of points along each axis.
+            extent (float): The half-width of the square covered by the mesh.
+
+        Returns:
+            tuple: The X, Y and Z arrays of the mesh, read-only since they are shared between simulations.
+        """
+        grid = np.linspace(-extent, extent, n)
+        X, Y = np.meshgrid(grid, grid)
+        Z = Drap.h(X, Y)
+        for mesh in (X, Y, Z):
+            mesh.flags.writeable = False
+        return X, Y, Z
+
     def _set_axes_equal(self, ax):
         x_limits, y_limits, z_limits = ax.get_xlim3d(), ax.get_ylim3d(), ax.get_zlim3d()
         x_range, y_range, z_range = [
@@ -1,4 +1,4 @@
-from constantes import *
+from functools import cached_property
 import numpy as np
 from drap import Drap
 
@@ -11,16 +11,28 @@ class Soleil:
     def __init__(self, radius, mass):
         self._radius = radius
         self._mass = mass
-        self._u = np.linspace(0, 2 * np.pi, 40) # Use of linspace to create an array of angles for the Sun's surface
-        self._v = np.linspace(0, np.pi, 20)
 
-        self._X_sun = sun_radius * np.outer(
-            np.cos(self._u), np.sin(self._v)
-        )  # Use of the outer product to create the 3D coordinates of the Sun's surface
-        self._Y_sun = sun_radius * np.outer(np.sin(self._u), np.sin(self._v))
-        self._Z_sun = sun_radius * np.outer(
-            np.ones_like(self._u), np.cos(self._v)
-        ) + Drap.h(0, 0)
+    @cached_property
+    def _surface(self):
+        """
+        Builds the 3D coordinates of the Sun's surface on first access, so that runs which never plot skip it.
+
+        Returns:
+            tuple: The X, Y and Z arrays of the Sun's surface.
+        """
+        u = np.linspace(0, 2 * np.pi, 40) # Use of linspace to create an array of angles for the Sun's surface
+        v = np.linspace(0, np.pi, 20)
+
+        cu, su = np.cos(u)[:, None], np.sin(u)[:, None]
+        cv, sv = np.cos(v)[None, :], np.sin(v)[None, :]
+        X = (
+            self._radius * cu * sv
+        )  # Broadcasting (40, 1) x (1, 20) gives the 3D coordinates of the Sun's surface
+        Y = self._radius * su * sv
+        Z = np.broadcast_to(
+            self._radius * cv + Drap.h(0, 0), (u.size, v.size)
+        )  # Z only depends on v, so the rows are a read-only view of the same values
+        return X, Y, Z
 
     @property
     def get_radius(self):
@@ -32,12 +44,12 @@ class Soleil:
 
     @property
     def get_X_sun(self):
-        return self._X_sun
+        return self._surface[0]
 
     @property
     def get_Y_sun(self):
-        return self._Y_sun
+        return self._surface[1]
 
     @property
     def get_Z_sun(self):
-        return self._Z_sun
+        return self._surface[2]